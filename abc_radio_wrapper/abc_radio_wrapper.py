@@ -7,14 +7,302 @@ are used to provide structured data and functionality to the result
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, Iterator, List, Optional, TypedDict, cast
+import asyncio
+import functools
+import itertools
+import json
+import logging
+import sys
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta, timezone
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypedDict,
+    cast,
+)
+from urllib.parse import quote_plus, urlencode
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from typing_extensions import Unpack
 
-BASE_URL = "https://music.abcradio.net.au/api/v1/plays/search.json"
+from . import __version__
+
+if TYPE_CHECKING:
+    import httpx
+
+__all__ = [
+    "API_HOST",
+    "BASE_URL",
+    "USER_AGENT",
+    "AVAILABLE_STATIONS",
+    "ABCRadio",
+    "ABCRadioError",
+    "RequestParams",
+    "RadioSong",
+    "SearchResult",
+    "Song",
+    "Artist",
+    "Album",
+    "Artwork",
+    "ArtworkSize",
+]
+
+_json_loads: Callable[[bytes], Any]
+try:
+    # orjson is an optional, considerably faster, drop in replacement for json.loads
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+_parse_document: Callable[[bytes], Any]
+_simdjson_local = threading.local()
+try:
+    # pysimdjson parses into lazy proxy objects, only the fields read by the
+    # from_json methods are ever converted into python objects
+    import simdjson
+
+    def _simdjson_parse(body: bytes) -> Any:
+        """
+        Parse body with the simdjson.Parser of the current thread, the parser
+        is reused between calls. Documents are only valid until their parser
+        parses again, a parser whose last document is still referenced is replaced
+        """
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        try:
+            return parser.parse(body)
+        except RuntimeError:
+            parser = _simdjson_local.parser = simdjson.Parser()
+            return parser.parse(body)
+
+    _parse_document = _simdjson_parse
+except ImportError:  # pragma: no cover
+    _parse_document = _json_loads
+
+logger = logging.getLogger(__name__)
+
+API_HOST = "https://music.abcradio.net.au"
+BASE_URL = API_HOST + "/api/v1/plays/search.json"
+USER_AGENT = "abc_radio_wrapper/" + __version__
+_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+AVAILABLE_STATIONS: Tuple[str, ...] = (
+    "jazz",
+    "dig",
+    "doublej",
+    "unearthed",
+    "country",
+    "triplej",
+    "classic",
+    "kidslisten",
+)
+_STATION_SET = frozenset(AVAILABLE_STATIONS)
+_MAX_RETRIES = 5
+_TZ_CACHE: Dict[str, timezone] = {}
+_COLUMNS = (
+    "played_time",
+    "channel",
+    "title",
+    "duration",
+    "url",
+    "artist_names",
+    "album_title",
+    "release_year",
+    "artwork_url",
+)
+
+
+def _parse_played_py(played_time: str) -> datetime:
+    """
+    Parse the fixed width "2020-01-01T12:00:00+00:00" timestamps returned by
+    the API, the tzinfo object is shared between all timestamps with the same
+    utc offset. Any other format is handed to datetime.fromisoformat
+    """
+    if len(played_time) != 25 or played_time[19] not in "+-":
+        return datetime.fromisoformat(played_time)
+    utc_offset = played_time[19:]
+    tz = _TZ_CACHE.get(utc_offset)
+    if tz is None:
+        delta = timedelta(hours=int(utc_offset[1:3]), minutes=int(utc_offset[4:6]))
+        tz = timezone(-delta if utc_offset[0] == "-" else delta)
+        _TZ_CACHE[utc_offset] = tz
+    return datetime(
+        int(played_time[0:4]),
+        int(played_time[5:7]),
+        int(played_time[8:10]),
+        int(played_time[11:13]),
+        int(played_time[14:16]),
+        int(played_time[17:19]),
+        tzinfo=tz,
+    )
+
+
+_parse_played: Callable[[str], datetime]
+try:
+    # ciso8601 is an optional C parser for ISO 8601 timestamps, many times
+    # faster than the pure python version above
+    from ciso8601 import parse_datetime as _parse_played
+except ImportError:  # pragma: no cover
+    _parse_played = _parse_played_py
+
+
+def _format_datetime(value: datetime) -> str:
+    """
+    Format value as "%Y-%m-%dT%H:%M:%S.%fZ", the fixed format is built
+    directly from the datetime fields instead of going through strftime
+    """
+    return (
+        f"{value.year:04d}-{value.month:02d}-{value.day:02d}"
+        f"T{value.hour:02d}:{value.minute:02d}:{value.second:02d}"
+        f".{value.microsecond:06d}Z"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_ratio(aspect_ratio: str) -> float:
+    """
+    Convert an aspect ratio such as "16x9" into a float, a response only
+    uses a handful of distinct ratios so each is only parsed once
+    """
+    width_ratio, height_ratio = aspect_ratio.split("x")
+    return int(width_ratio) / int(height_ratio)
+
+
+def _check_station(params: RequestParams) -> None:
+    """
+    Raise ValueError when params names a station the API does not have,
+    instead of sending a request that can only come back empty
+    """
+    station = params.get("station")
+    if station is not None and station not in _STATION_SET:
+        raise ValueError(
+            f"unknown station {station!r}, expected one of {AVAILABLE_STATIONS}"
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_params(station: Optional[str], limit: Optional[int]) -> Tuple[str, str]:
+    """
+    Url encode the station and limit parts of a query string, which rarely
+    change while paginating so each pair is only encoded once. The offset
+    changes on every page and is encoded separately
+    """
+    return (
+        urlencode({"station": station}) if station is not None else "",
+        urlencode({"limit": limit}) if limit is not None else "",
+    )
+
+
+def _query_parts(params: RequestParams) -> Tuple[str, str]:
+    """
+    The encoded parameters that go before and after the offset in a query
+    string: from, to and station before it and limit after it. Every query
+    url is built from these, so a page always has the same url
+    """
+    from_ = params.get("from_")
+    to = params.get("to")
+    # formatted timestamps only contain characters that are safe in a url
+    head: List[str] = []
+    if from_ is not None:
+        head.append("from=" + _format_datetime(from_))
+    if to is not None:
+        head.append("to=" + _format_datetime(to))
+    station, limit = _encode_params(params.get("station"), params.get("limit"))
+    if station:
+        head.append(station)
+    return "&".join(head), limit
+
+
+def _parse_page(body: bytes) -> SearchResult:
+    """
+    Convert a raw search response into a SearchResult, module level so it
+    can be sent to worker processes
+    """
+    return SearchResult.from_json(json_input=_parse_document(body))
+
+
+def _retry_after(header: Optional[str]) -> float:
+    """
+    Number of seconds to wait from a Retry-After header, the http-date form
+    and missing headers fall back to waiting one second
+    """
+    try:
+        return max(float(header), 0.0) if header is not None else 1.0
+    except ValueError:
+        return 1.0
+
+
+def _find_release(json_input: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """
+    Return the release (album) json of a play, occassionally release information
+    is not present or only exists under recordings.releases json key
+    """
+    json_release = json_input.get("release")
+    if not json_release:
+        releases = json_input["recording"].get("releases")
+        json_release = releases[0] if releases else None
+    return json_release
+
+
+def _iter_stream(raw: Any, page: Dict[str, int]) -> Iterator[RadioSong]:
+    """
+    Incrementally parse a search response (any file like object) with ijson,
+    each RadioSong is yielded as soon as its json has been received. The
+    total, offset and limit values are stored in page as they are encountered.
+    Like SearchResult.from_json a missing or non list items raises
+    """
+    import ijson  # type: ignore
+
+    radio_song_from_json = RadioSong.from_json
+    artist_cache: Dict[str, Artist] = {}
+    album_cache: Dict[str, Album] = {}
+    builder = None
+    has_items = False
+    for prefix, event, value in ijson.parse(raw):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "items.item" and event == "end_map":
+                yield radio_song_from_json(builder.value, artist_cache, album_cache)
+                builder = None
+        elif prefix == "items.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix in ("total", "offset", "limit"):
+            page[prefix] = value
+        elif prefix == "items" and event != "end_array":
+            if event != "start_array":
+                raise TypeError(f"items is {event}, not a list")
+            has_items = True
+    if not has_items:
+        raise KeyError("items")
+
+
+class ABCRadioError(Exception):
+    """
+    Raised when a search fails: the API could not be reached, answered with
+    an error status or sent a response that could not be parsed. The
+    original exception is available as __cause__
+    """
 
 
 class ABCRadio:
@@ -24,16 +312,117 @@ class ABCRadio:
 
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_size: int = 256,
+        stream: bool = False,
+        http2: bool = False,
+        timeout: float = 30,
+    ) -> None:
         """
         Initialize the ABCRadio class for searching
+
+        Parameters
+        ----------
+        cache_size: int
+            number of search results kept in memory, only searches with a
+            'to' datetime in the past are cached as their results can not change
+
+        stream: bool
+            parse responses while they are still being received, useful for
+            large limit values. Requires the optional ijson dependency
+            (pip install abc_radio_wrapper[stream])
+
+        http2: bool
+            send requests over a single multiplexed HTTP/2 connection with httpx
+            instead of requests, only worthwhile when the API host negotiates h2.
+            Requires the optional httpx dependency (pip install abc_radio_wrapper[http2])
+            and can not be combined with stream. continuous_search_async is
+            not affected
+
+        timeout: float
+            seconds to wait for the API before giving up on a request
         """
+        if stream and http2:
+            raise ValueError("stream and http2 can not be used together")
+        # failures of a request or its parsing, re-raised as ABCRadioError.
+        # Bodies are read from urllib3 directly, so its errors are not
+        # translated into requests exceptions
+        self._request_errors: Tuple[Type[Exception], ...] = (
+            requests.RequestException,
+            urllib3.exceptions.HTTPError,
+            ValueError,
+            KeyError,
+            TypeError,
+        )
+        if stream:
+            import ijson  # type: ignore
+
+            self._request_errors += (ijson.JSONError,)
 
-        self.available_stations: List[
-            str
-        ] = "jazz,dig,doublej,unearthed,country,triplej,classic,kidslisten".split(",")
+        self.available_stations: Tuple[str, ...] = AVAILABLE_STATIONS
         self.BASE_URL: str = BASE_URL
         self.latest_search_parameters: Optional[RequestParams] = None
+        self.timeout = timeout
+
+        # every request goes to the same host, so a single pooled session
+        # keeps the connection alive between pages instead of paying for a
+        # new TCP+TLS handshake on each call
+        self._session = requests.Session()
+        self._mount_adapter(pool_maxsize=20)
+        self._session.headers.update(_HEADERS)
+        self._http2_client: Optional[httpx.Client] = None
+        if http2:
+            from httpx import Client, HTTPError, Limits
+
+            self._request_errors += (HTTPError,)
+            self._http2_client = Client(
+                http2=True,
+                headers=_HEADERS,
+                limits=Limits(max_keepalive_connections=10),
+                timeout=timeout,
+            )
+
+        self._cache: OrderedDict[str, SearchResult] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        self._stream = stream
+
+    def _mount_adapter(self, pool_maxsize: int) -> None:
+        """
+        (Re)mount the connection pool used for the API host, pool_maxsize
+        should be at least the number of concurrent requests
+        """
+        self._session.mount(
+            API_HOST, HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        )
+        self._pool_maxsize = pool_maxsize
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections
+        """
+        self._session.close()
+        if self._http2_client is not None:
+            self._http2_client.close()
+
+    def __enter__(self) -> ABCRadio:
+        """
+        Allow the wrapper to be used as a context manager e.g.
+        with ABCRadio() as ABC:
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Close the session when leaving the with block
+        """
+        self.close()
 
     def search(self, **params: Unpack[RequestParams]) -> "SearchResult":
         """Send request to abc radio API endpoint and create SearchResult instance
@@ -41,18 +430,99 @@ class ABCRadio:
         Parameters
         ----------
         **params: RequestParams
-            params["channel"]:str any of channels in self.available_stations
+            params["station"]:str any of the stations in AVAILABLE_STATIONS
             params['startDate']: datetime
+
+        Raises
+        ------
+        ValueError
+            if params["station"] is not in AVAILABLE_STATIONS
+
+        ABCRadioError
+            if the request fails or the response can not be parsed
         """
+        _check_station(params)
 
         query_url = self.BASE_URL + self.construct_query_string(**params)
-        r = requests.get(query_url)
-        json_respose = r.json()
-        result = SearchResult.from_json(json_input=json_respose)
+        result = self._search_url(query_url, self._is_cacheable(params))
         self.latest_offset = result.offset
         self.latest_search_parameters = cast(RequestParams, params)
         return result
 
+    def _search_url(self, query_url: str, cacheable: bool = False) -> SearchResult:
+        """
+        Request an already constructed query url and parse the response,
+        cacheable results are kept in a least recently used cache keyed by url
+        """
+        if cacheable:
+            with self._cache_lock:
+                cached = self._cache.get(query_url)
+                if cached is not None:
+                    self._cache.move_to_end(query_url)
+                    return cached
+
+        try:
+            result = self._request_page(query_url)
+        except self._request_errors as exc:
+            raise ABCRadioError(f"search failed for {query_url}: {exc}") from exc
+
+        if cacheable and self._cache_size > 0:
+            with self._cache_lock:
+                self._cache[query_url] = result
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def _request_page(self, query_url: str) -> SearchResult:
+        """Request a single page and parse it, errors are left to the caller"""
+        if self._stream:
+            with self._session.get(query_url, stream=True, timeout=self.timeout) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                page: Dict[str, int] = {}
+                radio_songs = list(_iter_stream(r.raw, page))
+            return SearchResult(radio_songs=radio_songs, **page)
+
+        if self._http2_client is not None:
+            response = self._http2_client.get(query_url)
+            response.raise_for_status()
+            content = response.content
+        else:
+            with self._session.get(query_url, stream=True, timeout=self.timeout) as r:
+                r.raise_for_status()
+                # decompressed straight from urllib3, Response.content
+                # would copy the body again joining 10kB chunks
+                content = r.raw.read(decode_content=True)
+        json_respose = _parse_document(content)
+        return SearchResult.from_json(json_input=json_respose)
+
+    @staticmethod
+    def _is_cacheable(params: RequestParams) -> bool:
+        """
+        Results can only be cached once the searched window has closed,
+        without a 'to' datetime the results change as new songs are played
+        """
+        to = params.get("to")
+        if to is None:
+            return False
+        # read the same way as construct_query_string, which sends the clock
+        # fields of to as UTC whatever its tzinfo
+        return to.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc)
+
+    def _page_urls(
+        self, params: RequestParams, offsets: Iterable[int]
+    ) -> Iterator[str]:
+        """
+        Construct the query url for params at each offset, only the offset
+        changes between pages so everything else is formatted once. The urls
+        are the same as construct_query_string gives for that offset
+        """
+        head, limit = _query_parts(params)
+        prefix = self.BASE_URL + "?" + (head + "&" if head else "") + "offset="
+        suffix = "&" + limit if limit else ""
+        for offset in offsets:
+            yield prefix + str(offset) + suffix
+
     @staticmethod
     def construct_query_string(**params: Unpack[RequestParams]) -> str:
         """
@@ -66,34 +536,36 @@ class ABCRadio:
             internally this will return the keys order:'from','to','station',''offset','limit'
             although the ordering is not a requirement of the underlying web API
         """
-        from_ = params.pop("from_", None)
-        to = params.pop("to", None)
-        station = params.pop("station", None)
-        offset = params.pop("offset", None)
-        limit = params.pop("limit", None)
-        params_list = []
-        if from_ is not None:
-            params_list.append("from=" + from_.strftime("%Y-%m-%dT%H:%M:%S.%fZ"))
-        if to is not None:
-            params_list.append("to=" + to.strftime("%Y-%m-%dT%H:%M:%S.%fZ"))
-        if station is not None:
-            params_list.append("station=" + str(station))
-        if offset is not None:
-            params_list.append("offset=" + str(offset))
-        if limit is not None:
-            params_list.append("limit=" + str(limit))
-
-        if len(params_list) >= 1:
-            return "?" + "&".join(params_list)
+        head, limit = _query_parts(params)
+        parts = [head] if head else []
+        offset = params.get("offset")
+        if type(offset) is int:
+            parts.append("offset=" + str(offset))
+        elif offset is not None:
+            parts.append("offset=" + quote_plus(str(offset)))
+        if limit:
+            parts.append(limit)
+
+        if parts:
+            return "?" + "&".join(parts)
         else:
             return ""
 
     def continuous_search(
-        self, **params: Unpack[RequestParams]
+        self, window: int = 8, **params: Unpack[RequestParams]
     ) -> Iterator[SearchResult]:
         """
         generate next set of search results each time the function is called.
 
+        While the caller works through a page the next few pages are already
+        being requested in background threads, results are still yielded in
+        offset order.
+
+        Parameters
+        ----------
+        window: int
+            number of pages requested ahead of the one being yielded
+
         Examples
         --------
         for searchresult in ABC.continuous_search():
@@ -113,10 +585,324 @@ class ABCRadio:
         total = initial_search.total
         offset = initial_search.offset
         limit = initial_search.limit
-        while offset + limit < total:
-            offset = offset + limit
-            params["offset"] = offset
-            yield self.search(**params)
+        if not limit:
+            # there are no further pages to step through without a page size
+            return
+        cacheable = self._is_cacheable(params)
+        query_urls = self._page_urls(params, range(offset + limit, total, limit))
+
+        if window > self._pool_maxsize:
+            self._mount_adapter(pool_maxsize=window)
+        executor = ThreadPoolExecutor(max_workers=window)
+        pending: Deque[Future[SearchResult]] = deque(
+            executor.submit(self._search_url, query_url, cacheable)
+            for query_url in itertools.islice(query_urls, window)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                # keep the window full while the caller handles this page
+                for query_url in itertools.islice(query_urls, 1):
+                    pending.append(
+                        executor.submit(self._search_url, query_url, cacheable)
+                    )
+                self.latest_offset = result.offset
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def search_all(
+        self, workers: int = 8, **params: Unpack[RequestParams]
+    ) -> List[SearchResult]:
+        """
+        Request every page matching params and return them in offset order.
+
+        The first page gives the total, the remaining pages are then requested
+        concurrently from up to workers threads sharing the pooled session.
+
+        Parameters
+        ----------
+        workers: int
+            number of pages requested at the same time
+        """
+        return list(self.continuous_search(window=workers, **params))
+
+    def search_iter(self, **params: Unpack[RequestParams]) -> Iterator[RadioSong]:
+        """
+        Generate every RadioSong matching params, one page is requested at a
+        time and only the songs of the current page are kept in memory.
+
+        With the optional ijson dependency (pip install abc_radio_wrapper[stream])
+        each song is parsed and yielded while its page is still downloading,
+        otherwise a page is parsed in full before its songs are yielded.
+
+        Examples
+        --------
+        for radio_song in ABC.search_iter(from_=startDate, to=endDate):
+                print(radio_song.song.title)
+        """
+        _check_station(params)
+        try:
+            import ijson  # type: ignore
+        except ImportError:
+            stream = False
+        else:
+            stream = self._http2_client is None
+            stream_errors = self._request_errors + (ijson.JSONError,)
+        cacheable = self._is_cacheable(params)
+
+        # the first page has the same url as search(**params)
+        query_url = self.BASE_URL + self.construct_query_string(**params)
+        while True:
+            if stream:
+                page: Dict[str, int] = {}
+                try:
+                    with self._session.get(
+                        query_url, stream=True, timeout=self.timeout
+                    ) as r:
+                        r.raise_for_status()
+                        r.raw.decode_content = True
+                        yield from _iter_stream(r.raw, page)
+                    total, offset, limit = page["total"], page["offset"], page["limit"]
+                except stream_errors as exc:
+                    raise ABCRadioError(
+                        f"search failed for {query_url}: {exc}"
+                    ) from exc
+            else:
+                result = self._search_url(query_url, cacheable)
+                total, offset, limit = result.total, result.offset, result.limit
+                yield from result.radio_songs
+                # released before the next page is requested
+                del result
+            self.latest_offset = offset
+            offset += limit
+            if not limit or offset >= total:
+                return
+            query_url = next(self._page_urls(params, (offset,)))
+
+    async def continuous_search_async(
+        self,
+        concurrency: int = 10,
+        rate: float = 10,
+        per_seconds: float = 1,
+        **params: Unpack[RequestParams],
+    ) -> List[SearchResult]:
+        """
+        Asynchronous version of continuous_search, the first request learns the
+        total number of results and the remaining pages are then requested
+        concurrently. Requires the optional aiohttp and aiolimiter dependencies
+        (pip install abc_radio_wrapper[async]).
+
+        Parameters
+        ----------
+        concurrency: int
+            maximum number of requests in flight at any one time
+
+        rate: float
+            maximum number of requests started every per_seconds seconds,
+            rate limited (429) responses are retried after the Retry-After delay
+
+        per_seconds: float
+            length of the rate limiting period
+
+        Returns
+        _______
+        List[SearchResult]
+            every page of results, ordered by offset
+
+        Examples
+        --------
+        search_results = asyncio.run(ABC.continuous_search_async(station="jazz"))
+
+        Warnings
+        --------
+        see continuous_search, without any parameters this will request
+        every page available from the underlying API.
+        """
+
+        async def parse(body: bytes) -> SearchResult:
+            return _parse_page(body)
+
+        return await self._search_pages_async(
+            parse, concurrency, rate, per_seconds, params
+        )
+
+    async def crawl(
+        self,
+        concurrency_io: int = 16,
+        concurrency_cpu: Optional[int] = None,
+        rate: float = 10,
+        per_seconds: float = 1,
+        **params: Unpack[RequestParams],
+    ) -> List[SearchResult]:
+        """
+        Bulk version of continuous_search_async for very large searches, once
+        responses arrive concurrently converting the json into SearchResults
+        becomes the bottleneck, so pages are parsed in a pool of worker
+        processes. Requires the optional aiohttp and aiolimiter dependencies
+        (pip install abc_radio_wrapper[async]).
+
+        Parameters
+        ----------
+        concurrency_io: int
+            maximum number of requests in flight at any one time
+
+        concurrency_cpu: Optional[int]
+            number of worker processes parsing responses, defaults to os.cpu_count()
+
+        rate: float
+            maximum number of requests started every per_seconds seconds
+
+        per_seconds: float
+            length of the rate limiting period
+
+        Returns
+        _______
+        List[SearchResult]
+            every page of results, ordered by offset
+
+        Examples
+        --------
+        if __name__ == "__main__":
+            search_results = asyncio.run(ABC.crawl(from_=startDate, to=endDate))
+        """
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=concurrency_cpu) as pool:
+
+            async def parse(body: bytes) -> SearchResult:
+                return await loop.run_in_executor(pool, _parse_page, body)
+
+            return await self._search_pages_async(
+                parse, concurrency_io, rate, per_seconds, params
+            )
+
+    async def _search_pages_async(
+        self,
+        parse: Callable[[bytes], Awaitable[SearchResult]],
+        concurrency: int,
+        rate: float,
+        per_seconds: float,
+        params: RequestParams,
+    ) -> List[SearchResult]:
+        """
+        Request the first page to learn the total and then every remaining page
+        concurrently, each response body is converted with parse. Results are
+        returned in offset order
+        """
+        _check_station(params)
+
+        import aiohttp
+        from aiolimiter import AsyncLimiter
+
+        async_errors = (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            ValueError,
+            KeyError,
+            TypeError,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = AsyncLimiter(rate, per_seconds)
+
+        async def fetch(session: aiohttp.ClientSession, query_url: str) -> SearchResult:
+            try:
+                for attempt in range(_MAX_RETRIES + 1):
+                    async with semaphore, rate_limiter:
+                        async with session.get(query_url) as resp:
+                            if resp.status != 429 or attempt == _MAX_RETRIES:
+                                resp.raise_for_status()
+                                body = await resp.read()
+                                break
+                            retry_after = _retry_after(resp.headers.get("Retry-After"))
+                    logger.debug(
+                        "rate limited requesting %s, retrying in %ss",
+                        query_url,
+                        retry_after,
+                    )
+                    # sleep outside of the semaphore so other requests can continue
+                    await asyncio.sleep(retry_after)
+                return await parse(body)
+            except async_errors as exc:
+                raise ABCRadioError(f"search failed for {query_url}: {exc}") from exc
+
+        async with aiohttp.ClientSession(
+            headers=_HEADERS, timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+            initial_search = await fetch(
+                session, self.BASE_URL + self.construct_query_string(**params)
+            )
+            total = initial_search.total
+            offset = initial_search.offset
+            limit = initial_search.limit
+            if not limit:
+                return [initial_search]
+            results = await asyncio.gather(
+                *(
+                    fetch(session, query_url)
+                    for query_url in self._page_urls(
+                        params, range(offset + limit, total, limit)
+                    )
+                )
+            )
+        return [initial_search, *results]
+
+
+class _SlottedResult:
+    """
+    Base class for the slotted dataclasses below. They are not frozen, a
+    frozen dataclass assigns every field through object.__setattr__ which
+    roughly doubles the cost of creating one. Results are meant to be read
+    only, cached search results are shared between callers.
+
+    Equality and hashing compare a tuple of the field values that is built on
+    first use and kept in the _key slot. Nested objects contribute their own
+    key and sequences become tuples of keys, so once built two results are
+    compared as plain tuples without calling back into python. Sequence
+    fields are stored as tuples so they can not be changed in place
+    """
+
+    __slots__: Tuple[str, ...] = ("_key",)
+    _key: Tuple[Any, ...]
+
+    def _get_key(self) -> Tuple[Any, ...]:
+        try:
+            return self._key
+        except AttributeError:
+            values = [
+                getattr(self, field.name)
+                for field in fields(self)  # type: ignore[arg-type]
+            ]
+            key = self._key = tuple(map(_key_of, values))
+            return key
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+        return self._get_key() == cast(_SlottedResult, other)._get_key()
+
+    def __hash__(self) -> int:
+        return hash(self._get_key())
+
+    def __getstate__(self) -> List[Any]:
+        # _key is a slot of this base class, so it is left out and rebuilt
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+
+def _key_of(value: Any) -> Any:
+    """Value of a field as it is stored in the _key of _SlottedResult"""
+    if isinstance(value, _SlottedResult):
+        return value._get_key()
+    if type(value) is tuple:
+        return tuple(map(_key_of, value))
+    return value
 
 
 class RequestParams(TypedDict, total=False):
@@ -149,8 +935,8 @@ class RequestParams(TypedDict, total=False):
     station: str
 
 
-@dataclass
-class RadioSong:
+@dataclass(eq=False)
+class RadioSong(_SlottedResult):
     """
     Dataclass for each entity returned from ABCradio.search,
     A RadioSong is a Song played at a specific time on a specific channel.
@@ -170,12 +956,19 @@ class RadioSong:
 
     """
 
+    __slots__ = ("played_time", "channel", "song")
+
     played_time: datetime
     channel: str
     song: Song
 
     @classmethod
-    def from_json(cls, json_input: dict[str, Any]) -> RadioSong:
+    def from_json(
+        cls,
+        json_input: dict[str, Any],
+        artist_cache: Optional[Dict[str, Artist]] = None,
+        album_cache: Optional[Dict[str, Album]] = None,
+    ) -> RadioSong:
         """
         Create RadioSong instance based on json_input
 
@@ -191,28 +984,40 @@ class RadioSong:
                  "release": ...     # Album details (see Album class for more details)
                  }
 
+        artist_cache: Optional[Dict[str, Artist]]
+            see Song.from_json
+
+        album_cache: Optional[Dict[str, Album]]
+            see Song.from_json
+
         Returns
         _______
         RadioSong
         """
-        song = Song.from_json(json_input)
+        song = Song.from_json(json_input, artist_cache, album_cache)
         return cls(
-            played_time=datetime.fromisoformat(json_input["played_time"]),
-            channel=json_input["service_id"],
+            played_time=_parse_played(json_input["played_time"]),
+            channel=sys.intern(json_input["service_id"]),
             song=song,
         )
 
 
-@dataclass
-class SearchResult:
+@dataclass(eq=False)
+class SearchResult(_SlottedResult):
     """
     Dataclass returned from ABCRadio.search
     """
 
+    __slots__ = ("total", "offset", "limit", "radio_songs")
+
     total: int
     offset: int
     limit: int
-    radio_songs: List["RadioSong"]
+    radio_songs: Sequence["RadioSong"]
+
+    def __post_init__(self) -> None:
+        if type(self.radio_songs) is not tuple:
+            self.radio_songs = tuple(self.radio_songs)
 
     @classmethod
     def from_json(cls, json_input: dict[str, Any]) -> SearchResult:
@@ -221,9 +1026,15 @@ class SearchResult:
         To see the expected json_format: https://music.abcradio.net.au/api/v1/plays/search.json
         """
 
-        radio_songs = []
-        for radio_song in json_input["items"]:
-            radio_songs.append(RadioSong.from_json(radio_song))
+        # bound once, the lookup would otherwise repeat for every play
+        radio_song_from_json = RadioSong.from_json
+        # artists and albums that appear in several plays of the page are shared
+        artist_cache: Dict[str, Artist] = {}
+        album_cache: Dict[str, Album] = {}
+        radio_songs = [
+            radio_song_from_json(item, artist_cache, album_cache)
+            for item in json_input["items"]
+        ]
         return cls(
             total=json_input["total"],
             offset=json_input["offset"],
@@ -231,22 +1042,112 @@ class SearchResult:
             radio_songs=radio_songs,
         )
 
+    @staticmethod
+    def from_json_columnar(json_input: dict[str, Any]) -> Dict[str, List[Any]]:
+        """
+        Flatten the result of a single request into columns without creating
+        RadioSong/Song/Artist/Album/Artwork objects, much cheaper to build and
+        analyse when only a few fields of many plays are needed.
+
+        Returns
+        _______
+        Dict[str, List[Any]]
+            one list per field, the nth entry of every list belongs to the
+            nth play: played_time, channel, title, duration, url, artist_names,
+            album_title, release_year, artwork_url
+        """
+        columns: Dict[str, List[Any]] = {name: [] for name in _COLUMNS}
+        (
+            add_played_time,
+            add_channel,
+            add_title,
+            add_duration,
+            add_url,
+            add_artist_names,
+            add_album_title,
+            add_release_year,
+            add_artwork_url,
+        ) = [columns[name].append for name in _COLUMNS]
+        parse_played = _parse_played
+        find_release = _find_release
+        intern = sys.intern
+
+        for item in json_input["items"]:
+            recording = item["recording"]
+            links = recording.get("links")
+            json_release = find_release(item)
+            add_played_time(parse_played(item["played_time"]))
+            add_channel(intern(item["service_id"]))
+            add_title(recording["title"])
+            add_duration(recording["duration"])
+            add_url(links[0]["url"] if links else None)
+            if json_release is not None:
+                json_artwork = json_release.get("artwork")
+                release_year = json_release.get("release_year")
+                add_artist_names(
+                    [artist["name"] for artist in json_release.get("artists") or ()]
+                )
+                add_album_title(json_release["title"])
+                add_release_year(int(release_year) if release_year else None)
+                add_artwork_url(json_artwork[0]["url"] if json_artwork else None)
+            else:
+                add_artist_names([])
+                add_album_title(None)
+                add_release_year(None)
+                add_artwork_url(None)
+        return columns
+
+    @staticmethod
+    def columns_to_arrow(columns: Dict[str, List[Any]]) -> Any:
+        """
+        Convert the output of from_json_columnar into a pyarrow.Table, ready
+        for pandas/polars. Requires the optional pyarrow dependency
+        (pip install abc_radio_wrapper[arrow])
+        """
+        import pyarrow as pa  # type: ignore
+
+        schema = pa.schema(
+            [
+                ("played_time", pa.timestamp("us", tz="UTC")),
+                ("channel", pa.string()),
+                ("title", pa.string()),
+                ("duration", pa.int32()),
+                ("url", pa.string()),
+                ("artist_names", pa.list_(pa.string())),
+                ("album_title", pa.string()),
+                ("release_year", pa.int32()),
+                ("artwork_url", pa.string()),
+            ]
+        )
+        return pa.Table.from_pydict(columns, schema=schema)
+
 
-@dataclass
-class Song:
+@dataclass(eq=False)
+class Song(_SlottedResult):
     """
     Dataclass to represent a song
 
     """
 
+    __slots__ = ("title", "duration", "artists", "album", "url")
+
     title: str
     duration: int
-    artists: List["Artist"]
+    artists: Sequence["Artist"]
     album: Optional[Album]
     url: Optional[str]
 
+    def __post_init__(self) -> None:
+        if type(self.artists) is not tuple:
+            self.artists = tuple(self.artists)
+
     @classmethod
-    def from_json(cls, json_input: dict[str, Any]) -> Song:
+    def from_json(
+        cls,
+        json_input: dict[str, Any],
+        artist_cache: Optional[Dict[str, Artist]] = None,
+        album_cache: Optional[Dict[str, Album]] = None,
+    ) -> Song:
         """
         Create Song instance based on json_input
 
@@ -262,51 +1163,52 @@ class Song:
                  "release": ...     # Album details
                  }
 
+        artist_cache: Optional[Dict[str, Artist]]
+            passed on to Artist.from_json, so an artist repeated across plays
+            is only created once
+
+        album_cache: Optional[Dict[str, Album]]
+            passed on to Album.from_json, likewise for albums
 
         Returns
         _______
         Song
         """
-        try:
-            # Occassionally release information is not present or only exists
-            # under recordings.releases json key
-            json_release = (
-                json_input["release"]
-                if json_input["release"]
-                else json_input["recording"]["releases"][0]
-            )
-            album = Album.from_json(json_release)
-            artists = []
-            for artist in json_release["artists"]:
-                artists.append(Artist.from_json(artist))
-        except (KeyError, IndexError, TypeError):
+        recording = json_input["recording"]
+        json_release = _find_release(json_input)
+
+        album: Optional[Album]
+        if json_release is not None:
+            album = Album.from_json(json_release, album_cache)
+            artists = [
+                Artist.from_json(artist, artist_cache)
+                for artist in json_release.get("artists") or ()
+            ]
+        else:
             artists = []
             album = None
 
-        url = Song.get_url(json_input)
         return cls(
-            title=json_input["recording"]["title"],
-            duration=json_input["recording"]["duration"],
+            title=recording["title"],
+            duration=recording["duration"],
             artists=artists,
             album=album,
-            url=url,
+            url=Song.get_url(json_input),
         )
 
     @staticmethod
-    def get_url(json_input):
+    def get_url(json_input: dict[str, Any]) -> Optional[str]:
         """
         Occassionally the url to musicbrainz will be missing,
         make the proper check and return the url if it exists
         otherwise return null
         """
-        if len(json_input["recording"]["links"]) >= 1:
-            return json_input["recording"]["links"][0]["url"]
-        else:
-            return None
+        links = json_input["recording"].get("links")
+        return links[0]["url"] if links else None
 
 
-@dataclass
-class Artist:
+@dataclass(eq=False)
+class Artist(_SlottedResult):
     """
     Dataclass to represent Artists
 
@@ -323,6 +1225,8 @@ class Artist:
         Almost always will be null, the underlying REST api rarely provides a value
     """
 
+    __slots__ = ("url", "name", "is_australian")
+
     url: Optional[
         str
     ]  # http://musicbrainz.org/ws/2/artist/5b11f4ce-a62d-471e-81fc-a69a8278c7da\?inc\=aliases
@@ -330,25 +1234,68 @@ class Artist:
     is_australian: Optional[bool]
 
     @classmethod
-    def from_json(cls, json_input: dict[str, Any]) -> Artist:
+    def from_json(
+        cls, json_input: dict[str, Any], cache: Optional[Dict[str, Artist]] = None
+    ) -> Artist:
         """
         Construct the Artist object from the json representation in
         https://music.abcradio.net.au/api/v1/plays/search.json
 
+        cache: Optional[Dict[str, Artist]]
+            artists already created keyed by their arid, an artist found in
+            cache is returned instead of creating a duplicate
         """
-        if json_input["is_australian"] is None:
-            is_australian = None
-        else:
-            is_australian = bool(json_input["is_australian"])
-        if len(json_input["links"]) >= 1:
-            url = json_input["links"][0]["url"]
-        else:
-            url = None
-        return cls(url=url, name=json_input["name"], is_australian=is_australian)
+        arid = json_input.get("arid")
+        if cache is not None and arid is not None:
+            artist = cache.get(arid)
+            if artist is not None:
+                return artist
+
+        links = json_input.get("links")
+        # already a bool (or null) once decoded, no coercion needed
+        artist = cls(
+            url=links[0]["url"] if links else None,
+            name=json_input["name"],
+            is_australian=json_input["is_australian"],
+        )
+        if cache is not None and arid is not None:
+            cache[arid] = artist
+        return artist
+
+
+class _LazyArtwork:
+    """
+    Descriptor used as the artwork field of Album. Album.from_json only
+    stores the artwork json in the _artwork_raw slot, the Artwork and every
+    ArtworkSize are built the first time artwork is read. Comparing, hashing
+    or printing an album reads every field, so it builds the artwork too
+    """
+
+    def __get__(self, album: Any, owner: Any = None) -> Optional[Artwork]:
+        if album is None:
+            # no class level default, artwork stays a required field
+            raise AttributeError("artwork")
+        json_artwork = album._artwork_raw
+        if json_artwork is not None:
+            album._artwork = Artwork.from_json(json_artwork)
+            album._artwork_raw = None
+        return album._artwork
 
+    def __set__(self, album: Any, artwork: Optional[Artwork]) -> None:
+        album._artwork = artwork
+        album._artwork_raw = None
+
+    @staticmethod
+    def defer(album: Any, json_artwork: dict[str, Any]) -> None:
+        """Replace the artwork of album with json_artwork, built when first read"""
+        # simdjson proxies are only valid until their parser is reused,
+        # so they are copied into a dict to be read later
+        as_dict = getattr(json_artwork, "as_dict", None)
+        album._artwork_raw = as_dict() if as_dict is not None else json_artwork
 
-@dataclass
-class Album:
+
+@dataclass(eq=False)
+class Album(_SlottedResult):
     """
     Dataclass to represent an album (referred to as "releases" in underlying web API).
     A song can be featured on several albums.
@@ -356,37 +1303,61 @@ class Album:
 
     """
 
+    __slots__ = ("url", "title", "_artwork", "_artwork_raw", "release_year")
+
     url: Optional[str]
     title: str
     artwork: Optional[Artwork]
+    if not TYPE_CHECKING:
+        # a descriptor-typed field, see _LazyArtwork
+        artwork = _LazyArtwork()
     release_year: Optional[int]
 
     @classmethod
-    def from_json(cls, json_input: dict[str, Any]) -> Album:
-        try:
-            artwork = Artwork.from_json(json_input["artwork"][0])
-        except IndexError:
-            artwork = None
+    def from_json(
+        cls, json_input: dict[str, Any], cache: Optional[Dict[str, Album]] = None
+    ) -> Album:
+        """
+        Construct the Album object from a release in
+        https://music.abcradio.net.au/api/v1/plays/search.json
 
-        return cls(
+        cache: Optional[Dict[str, Album]]
+            albums already created keyed by the arid of their release, the
+            links point to a musicbrainz release group which several releases
+            can share
+        """
+        arid = json_input.get("arid")
+        if cache is not None and arid is not None:
+            album = cache.get(arid)
+            if album is not None:
+                return album
+
+        json_artwork = json_input.get("artwork")
+        release_year = json_input.get("release_year")
+        album = cls(
             url=Album.get_url(json_input),
             title=json_input["title"],
-            release_year=int(json_input["release_year"])
-            if json_input["release_year"]
-            else None,
-            artwork=artwork,
+            release_year=int(release_year) if release_year else None,
+            artwork=None,
         )
+        if json_artwork:
+            _LazyArtwork.defer(album, json_artwork[0])
+        if cache is not None and arid is not None:
+            cache[arid] = album
+        return album
 
     @staticmethod
-    def get_url(json_input):
-        if len(json_input["links"]) >= 1:
-            return json_input["links"][0]["url"]
-        else:
-            return None
+    def get_url(json_input: dict[str, Any]) -> Optional[str]:
+        """
+        Url of the musicbrainz release group of a release, None when the
+        release has no links
+        """
+        links = json_input.get("links")
+        return links[0]["url"] if links else None
 
 
-@dataclass
-class Artwork:
+@dataclass(eq=False)
+class Artwork(_SlottedResult):
     """
     Dataclass to represent the artwork of an associated Album.
     Each album can have several artworks and each artwork can have several
@@ -394,42 +1365,55 @@ class Artwork:
 
     """
 
+    __slots__ = ("url", "type", "sizes")
+
     url: str
     type: str
-    sizes: List[ArtworkSize]
+    sizes: Sequence[ArtworkSize]
+
+    def __post_init__(self) -> None:
+        if type(self.sizes) is not tuple:
+            self.sizes = tuple(self.sizes)
 
     @classmethod
     def from_json(cls, json_input: dict[str, Any]) -> Artwork:
-
-        sizes: List[ArtworkSize] = []
-        for size in json_input["sizes"]:
-            sizes.append(ArtworkSize.from_json(size))
-        return Artwork(url=json_input["url"], type=json_input["type"], sizes=sizes)
+        sizes = [ArtworkSize.from_json(size) for size in json_input["sizes"]]
+        return Artwork(
+            url=json_input["url"], type=sys.intern(json_input["type"]), sizes=sizes
+        )
 
 
-@dataclass
-class ArtworkSize:
+@dataclass(eq=False)
+class ArtworkSize(_SlottedResult):
     """
     Dataclass to represent the image format/size for each artwork.
     Most typical use case is providing large images or thumbnails for
     each different interface.
+
+    Attributes
+    ----------
+    aspect_ratio: str
+        e.g. "16x9"
+
+    aspect_ratio_float: float
+        aspect_ratio as a number e.g. 1.777..., calculated once on creation
     """
 
+    __slots__ = ("url", "width", "height", "aspect_ratio", "aspect_ratio_float")
+
     url: str
     width: int
     height: int
     aspect_ratio: str
 
+    def __post_init__(self) -> None:
+        self.aspect_ratio_float = _parse_ratio(self.aspect_ratio)
+
     @classmethod
     def from_json(cls, json_input: dict[str, Any]) -> ArtworkSize:
         return cls(
             url=json_input["url"],
             width=json_input["width"],
             height=json_input["height"],
-            aspect_ratio=json_input["aspect_ratio"],
+            aspect_ratio=sys.intern(json_input["aspect_ratio"]),
         )
-
-    @property
-    def aspect_ratio_float(self) -> float:
-        width_ratio, height_ratio = self.aspect_ratio.split("x")
-        return int(width_ratio) / int(height_ratio)
@@ -25,11 +25,28 @@ test_requirements = [
         "sphinx_rtd_theme",
         "interrogate",
         "coverage",
-        "isort"
+        "isort",
+        "aiohttp>=3.8.0",
+        "aiolimiter>=1.0.0",
+        "ijson>=3.1",
+        "httpx[http2]>=0.23.0",
+        "orjson>=3.8.0",
+        "pysimdjson>=5.0.0",
+        "ciso8601>=2.2.0",
 ]
 
 extras = {
     "test": test_requirements,
+    "async": ["aiohttp>=3.8.0", "aiolimiter>=1.0.0"],
+    "speedups": [
+        "orjson>=3.8.0",
+        "pysimdjson>=5.0.0",
+        "ciso8601>=2.2.0",
+        "urllib3[brotli,zstd]>=2.0.0",
+    ],
+    "stream": ["ijson>=3.1"],
+    "arrow": ["pyarrow>=7.0.0"],
+    "http2": ["httpx[http2]>=0.23.0"],
 }
 
 setup(
@@ -3,11 +3,21 @@
 """Tests for `abc_radio_wrapper` package."""
 
 
+import asyncio
+import copy
+import importlib.util
 import json
 import os
+import pickle
+import threading
+import time
 import unittest
-from datetime import datetime
-from typing import List
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+import urllib3
 
 from abc_radio_wrapper import abc_radio_wrapper
 
@@ -28,6 +38,58 @@ class TestAbc_radio_wrapper(unittest.TestCase):
         """Tear down test fixtures, if any."""
         pass
 
+    def serve(self, respond):
+        """
+        Answer GET requests from a local server with respond(path), which
+        returns (status, headers, body). body is bytes or an iterable of
+        chunks, sent as they are produced. Returns the url of the server
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, headers, body = respond(self.path)
+                if isinstance(body, bytes):
+                    headers = {"Content-Length": str(len(body)), **headers}
+                    body = [body]
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                try:
+                    for chunk in body:
+                        self.wfile.write(chunk)
+                        self.wfile.flush()
+                except ConnectionError:
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}/"
+
+    def serve_pages(self, total, requested):
+        """
+        serve empty pages of a search with total results from a local
+        server, the path of every request is appended to requested
+        """
+
+        def respond(path):
+            requested.append(path)
+            query = parse_qs(urlsplit(path).query)
+            page = {
+                "total": total,
+                "offset": int(query.get("offset", ["0"])[0]),
+                "limit": int(query.get("limit", ["10"])[0]),
+                "items": [],
+            }
+            return 200, {}, json.dumps(page).encode()
+
+        return self.serve(respond)
+
     def test_000_test_file_loaded(self):
         """Test setUp file is loaded"""
         self.assertEqual(self.json_search_result["total"], 142)
@@ -209,3 +271,546 @@ class TestAbc_radio_wrapper(unittest.TestCase):
         self.assertTrue(i > 2)
         self.assertEqual([0, 10, 20, 30], offsets)
         self.assertEqual(31, total)
+
+    def test_013_test_context_manager(self):
+        """test that ABCRadio can be used as a context manager with a pooled session"""
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            self.assertIsInstance(ABCWrapper, abc_radio_wrapper.ABCRadio)
+            self.assertEqual(
+                ABCWrapper._session.headers["User-Agent"], abc_radio_wrapper.USER_AGENT
+            )
+
+    def test_014_test_Search_iteration_async(self):
+        """
+        test that continuous_search_async requests every page
+        and returns them ordered by offset.
+        """
+        ABCWrapper = abc_radio_wrapper.ABCRadio()
+
+        startDate: datetime = datetime.fromisoformat("2020-04-30T03:00:00+00:00")
+        endDate: datetime = datetime.fromisoformat("2020-04-30T03:15:00+00:00")
+
+        searchresults = asyncio.run(
+            ABCWrapper.continuous_search_async(from_=startDate, to=endDate, limit=10)
+        )
+
+        self.assertEqual([0, 10, 20, 30], [result.offset for result in searchresults])
+        self.assertEqual(31, searchresults[-1].total)
+
+    def test_015_create_query_string_encoding(self):
+        """test that query string values are url encoded and empty params give no query"""
+        result: str = abc_radio_wrapper.ABCRadio.construct_query_string(
+            station="triple j&limit=1", limit=10
+        )
+
+        self.assertEqual("?station=triple+j%26limit%3D1&limit=10", result)
+        self.assertEqual("", abc_radio_wrapper.ABCRadio.construct_query_string())
+
+    def test_016_test_parse_played_time(self):
+        """test played_time parsing matches datetime.fromisoformat"""
+        for played_time in (
+            "2020-04-30T04:15:49+00:00",
+            "2020-04-30T04:15:49+10:00",
+            "2020-04-30T04:15:49-09:30",
+            "2020-04-30T04:15:49.123456+00:00",
+        ):
+            expected = datetime.fromisoformat(played_time)
+            for parse in (
+                abc_radio_wrapper._parse_played,
+                abc_radio_wrapper._parse_played_py,
+            ):
+                result = parse(played_time)
+                self.assertEqual(expected, result)
+                self.assertEqual(expected.utcoffset(), result.utcoffset())
+
+    def test_017_test_ArtworkSize_aspect_ratio_float(self):
+        """test aspect_ratio_float is calculated from aspect_ratio"""
+        sizes = self.json_search_result["items"][0]["release"]["artwork"][0]["sizes"]
+        ratios = {}
+        for size in sizes:
+            artwork_size = abc_radio_wrapper.ArtworkSize.from_json(size)
+            ratios[artwork_size.aspect_ratio] = artwork_size.aspect_ratio_float
+
+        self.assertEqual({"1x1": 1.0, "4x3": 4 / 3, "16x9": 16 / 9}, ratios)
+
+    def test_018_test_SearchResult_copy_and_pickle(self):
+        """test results survive a copy/pickle round trip"""
+        result = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+
+        self.assertEqual(result, copy.deepcopy(result))
+        self.assertEqual(result, pickle.loads(pickle.dumps(result)))
+
+    def test_019_test_stream_parsing(self):
+        """test incremental parsing gives the same result as SearchResult.from_json"""
+        TESTDATA_FILENAME = os.path.join(
+            os.path.dirname(__file__), "search_result.json"
+        )
+        page: Dict[str, int] = {}
+        with open(TESTDATA_FILENAME, "rb") as f:
+            radio_songs = list(abc_radio_wrapper._iter_stream(f, page))
+
+        expected = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+        result = abc_radio_wrapper.SearchResult(radio_songs=radio_songs, **page)
+        self.assertEqual(expected, result)
+
+    def test_020_test_Song_missing_release(self):
+        """test Song falls back to recording releases and handles no release at all"""
+        json_input = self.json_search_result["items"][7]
+        self.assertIsNone(json_input["release"])
+
+        result = abc_radio_wrapper.Song.from_json(json_input)
+        self.assertEqual("My Hero", result.album.title)
+
+        json_input = dict(json_input)
+        json_input["recording"] = dict(json_input["recording"], releases=[])
+        result = abc_radio_wrapper.Song.from_json(json_input)
+        self.assertIsNone(result.album)
+        self.assertEqual((), result.artists)
+
+    def test_021_test_package_exports(self):
+        """test the package re-exports a single definition of each public class"""
+        import abc_radio_wrapper as package
+
+        for name in abc_radio_wrapper.__all__:
+            self.assertIs(getattr(abc_radio_wrapper, name), getattr(package, name))
+        self.assertFalse(hasattr(package, "requests"))
+
+    def test_022_test_SearchResult_columnar(self):
+        """test the columnar representation matches the object representation"""
+        search_result = abc_radio_wrapper.SearchResult.from_json(
+            self.json_search_result
+        )
+        columns = abc_radio_wrapper.SearchResult.from_json_columnar(
+            self.json_search_result
+        )
+
+        radio_songs = search_result.radio_songs
+        self.assertEqual([r.played_time for r in radio_songs], columns["played_time"])
+        self.assertEqual([r.channel for r in radio_songs], columns["channel"])
+        for radio_song, channel in zip(radio_songs, columns["channel"]):
+            # both representations share the interned channel names
+            self.assertIs(radio_song.channel, channel)
+        self.assertEqual([r.song.title for r in radio_songs], columns["title"])
+        self.assertEqual([r.song.duration for r in radio_songs], columns["duration"])
+        self.assertEqual([r.song.url for r in radio_songs], columns["url"])
+        self.assertEqual(
+            [[a.name for a in r.song.artists] for r in radio_songs],
+            columns["artist_names"],
+        )
+        self.assertEqual(
+            [r.song.album.release_year if r.song.album else None for r in radio_songs],
+            columns["release_year"],
+        )
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_023_test_SearchResult_arrow(self):
+        """test columns can be converted to a pyarrow Table"""
+        columns = abc_radio_wrapper.SearchResult.from_json_columnar(
+            self.json_search_result
+        )
+        table = abc_radio_wrapper.SearchResult.columns_to_arrow(columns)
+
+        self.assertEqual(10, table.num_rows)
+        self.assertEqual(columns["title"], table.column("title").to_pylist())
+
+    def test_024_test_retry_after(self):
+        """test Retry-After header parsing used when rate limited"""
+        self.assertEqual(2.5, abc_radio_wrapper._retry_after("2.5"))
+        self.assertEqual(1.0, abc_radio_wrapper._retry_after(None))
+        self.assertEqual(
+            1.0, abc_radio_wrapper._retry_after("Wed, 21 Oct 2015 07:28:00 GMT")
+        )
+
+    def test_025_test_Album_artwork_is_lazy(self):
+        """test Album.artwork is only built when first read"""
+        json_release = self.json_search_result["items"][0]["release"]
+        result = abc_radio_wrapper.Album.from_json(json_release)
+
+        self.assertIsNone(result._artwork)
+        self.assertEqual(json_release["artwork"][0], result._artwork_raw)
+        self.assertEqual(
+            abc_radio_wrapper.Artwork.from_json(json_release["artwork"][0]),
+            result.artwork,
+        )
+        self.assertIs(result.artwork, result._artwork)
+        self.assertIsNone(result._artwork_raw)
+
+    def test_026_test_crawl(self):
+        """test that crawl parses every page in worker processes, ordered by offset"""
+        ABCWrapper = abc_radio_wrapper.ABCRadio()
+
+        startDate: datetime = datetime.fromisoformat("2020-04-30T03:00:00+00:00")
+        endDate: datetime = datetime.fromisoformat("2020-04-30T03:15:00+00:00")
+
+        searchresults = asyncio.run(
+            ABCWrapper.crawl(concurrency_cpu=2, from_=startDate, to=endDate, limit=10)
+        )
+
+        self.assertEqual([0, 10, 20, 30], [result.offset for result in searchresults])
+
+    def test_027_test_parse_page_from_bytes(self):
+        """test raw response bytes are decoded straight into a SearchResult"""
+        TESTDATA_FILENAME = os.path.join(
+            os.path.dirname(__file__), "search_result.json"
+        )
+        with open(TESTDATA_FILENAME, "rb") as f:
+            result = abc_radio_wrapper._parse_page(f.read())
+
+        expected = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+        self.assertEqual(expected, result)
+
+    def test_028_test_result_objects_have_no_dict(self):
+        """test every result object is slotted down to the artwork sizes"""
+        result = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+        radio_song = result.radio_songs[0]
+        song = radio_song.song
+        album = song.album
+        objects = [result, radio_song, song, song.artists[0], album]
+        if album is not None and album.artwork is not None:
+            objects += [album.artwork, album.artwork.sizes[0]]
+
+        for obj in objects:
+            with self.subTest(type(obj).__name__):
+                self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_029_test_Search_unknown_station(self):
+        """test an unknown station is rejected before any request is sent"""
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            self.assertIn("triplej", ABCWrapper.available_stations)
+            with self.assertRaises(ValueError):
+                ABCWrapper.search(station="triple j")
+
+    def test_031_test_Search_iter(self):
+        """test search_iter yields every song across all pages"""
+        startDate: datetime = datetime.fromisoformat("2020-04-30T03:00:00+00:00")
+        endDate: datetime = datetime.fromisoformat("2020-04-30T03:15:00+00:00")
+
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            radio_songs = list(
+                ABCWrapper.search_iter(from_=startDate, to=endDate, limit=10)
+            )
+
+        self.assertEqual(31, len(radio_songs))
+        self.assertIsInstance(radio_songs[0], abc_radio_wrapper.RadioSong)
+
+    def test_032_test_result_objects_are_hashable(self):
+        """test equal results hash alike so they can be used as dict keys"""
+        result = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+        other = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+
+        self.assertIsNot(result, other)
+        self.assertEqual(result, other)
+        self.assertEqual(hash(result), hash(other))
+        self.assertNotEqual(result.radio_songs[0], result.radio_songs[1])
+        self.assertNotEqual(result.radio_songs[0], result.radio_songs[0].song)
+
+        artists = {
+            artist
+            for radio_song in result.radio_songs + other.radio_songs
+            for artist in radio_song.song.artists
+        }
+        self.assertEqual(len({artist.name for artist in artists}), len(artists))
+
+    def test_033_test_SearchResult_shares_repeated_artists(self):
+        """test an artist or album repeated across plays is only created once"""
+        json_input = dict(self.json_search_result)
+        json_input["items"] = [json_input["items"][1]] * 2
+        first, second = abc_radio_wrapper.SearchResult.from_json(json_input).radio_songs
+
+        self.assertIsNot(first.song, second.song)
+        self.assertIs(first.song.album, second.song.album)
+        self.assertIs(first.song.artists[0], second.song.artists[0])
+
+    def test_034_test_Search_all(self):
+        """test search_all returns every page in offset order"""
+        startDate: datetime = datetime.fromisoformat("2020-04-30T03:00:00+00:00")
+        endDate: datetime = datetime.fromisoformat("2020-04-30T03:15:00+00:00")
+
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            searchresults = ABCWrapper.search_all(
+                workers=4, from_=startDate, to=endDate, limit=10
+            )
+
+        self.assertEqual([0, 10, 20, 30], [result.offset for result in searchresults])
+
+    def test_035_test_Search_error(self):
+        """test a failed request is raised as ABCRadioError"""
+        with abc_radio_wrapper.ABCRadio(timeout=5) as ABCWrapper:
+            # nothing listens on port 1, the connection is refused
+            ABCWrapper.BASE_URL = "http://127.0.0.1:1/api/v1/plays/search.json"
+            with self.assertRaises(abc_radio_wrapper.ABCRadioError):
+                ABCWrapper.search(station="jazz")
+
+    def test_036_test_result_sequences_are_tuples(self):
+        """test the songs, artists and sizes of a result can not be changed"""
+        result = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+        other = abc_radio_wrapper.SearchResult.from_json(self.json_search_result)
+        self.assertEqual(result, other)
+
+        song = other.radio_songs[1].song
+        artwork = song.album.artwork if song.album else None
+        self.assertIsInstance(other.radio_songs, tuple)
+        self.assertIsInstance(song.artists, tuple)
+        self.assertIsInstance(artwork.sizes if artwork else (), tuple)
+        with self.assertRaises(AttributeError):
+            other.radio_songs.pop()  # type: ignore[attr-defined]
+
+        # lists passed to the constructor are stored as tuples too
+        rebuilt = abc_radio_wrapper.SearchResult(
+            total=other.total,
+            offset=other.offset,
+            limit=other.limit,
+            radio_songs=list(other.radio_songs[:-1]),
+        )
+        self.assertIsInstance(rebuilt.radio_songs, tuple)
+        self.assertNotEqual(result, rebuilt)
+
+    def test_037_test_Search_cacheable_window(self):
+        """test only windows that are closed as sent to the API are cached"""
+        is_cacheable = abc_radio_wrapper.ABCRadio._is_cacheable
+        utc_now = datetime.now(timezone.utc)
+        aest = timezone(timedelta(hours=10))
+
+        self.assertFalse(is_cacheable({}))
+        self.assertTrue(is_cacheable({"to": utc_now - timedelta(hours=1)}))
+        self.assertFalse(is_cacheable({"to": utc_now + timedelta(hours=1)}))
+        # sent as <now + 9h>Z, the window is still open
+        self.assertFalse(
+            is_cacheable({"to": utc_now.astimezone(aest) - timedelta(hours=1)})
+        )
+        naive = utc_now.replace(tzinfo=None)
+        self.assertTrue(is_cacheable({"to": naive - timedelta(hours=1)}))
+
+    def test_038_test_Search_malformed_response(self):
+        """test a 200 response with an unexpected body raises ABCRadioError"""
+        responses = [
+            ({}, b"null"),
+            ({}, b'{"total": 1, "offset": 0, "limit": 10, "items": null}'),
+            ({}, b'{"offset": 0, "limit": 10, "items": []}'),
+            # truncated body
+            ({"Content-Length": "100"}, b'{"total": 1, "offset": 0, "items": ['),
+            # invalid compressed body
+            ({"Content-Encoding": "gzip"}, b"not gzip"),
+        ]
+
+        def respond(path):
+            headers, body = responses[int(path.rsplit("=", 1)[-1])]
+            return 200, headers, body
+
+        base_url = self.serve(respond)
+        options = [{}]
+        if importlib.util.find_spec("ijson"):
+            options.append({"stream": True})
+        for kwargs in options:
+            with abc_radio_wrapper.ABCRadio(**kwargs) as ABCWrapper:
+                ABCWrapper.BASE_URL = base_url
+                for offset in range(len(responses)):
+                    with self.subTest(offset=offset, **kwargs):
+                        with self.assertRaises(abc_radio_wrapper.ABCRadioError):
+                            ABCWrapper.search(offset=offset)
+
+    def test_039_test_Song_irregular_release(self):
+        """test a release missing optional keys still gives an album"""
+        json_input = dict(self.json_search_result["items"][1])
+        json_input["release"] = {
+            key: value
+            for key, value in json_input["release"].items()
+            if key not in ("links", "artwork", "release_year")
+        }
+
+        album = abc_radio_wrapper.Song.from_json(json_input).album
+        self.assertIsNotNone(album)
+        self.assertEqual(
+            (json_input["release"]["title"], None, None, None),
+            (album.title, album.url, album.artwork, album.release_year),
+        )
+        self.assertIsNone(abc_radio_wrapper.Album.get_url(json_input["release"]))
+        columns = abc_radio_wrapper.SearchResult.from_json_columnar(
+            {"items": [json_input]}
+        )
+        self.assertEqual([None], columns["release_year"])
+
+    def test_040_test_SearchResult_columnar_null_duration(self):
+        """test a recording without a duration gives None in its column"""
+        json_input = dict(self.json_search_result["items"][0])
+        json_input["recording"] = dict(json_input["recording"], duration=None)
+
+        columns = abc_radio_wrapper.SearchResult.from_json_columnar(
+            {"items": [json_input]}
+        )
+        self.assertEqual([None], columns["duration"])
+        if importlib.util.find_spec("pyarrow"):
+            table = abc_radio_wrapper.SearchResult.columns_to_arrow(columns)
+            self.assertEqual([None], table.column("duration").to_pylist())
+
+    @unittest.skipUnless(importlib.util.find_spec("ijson"), "requires ijson")
+    def test_041_test_Search_stream_stalled_response(self):
+        """test a body that stops arriving mid parse raises ABCRadioError"""
+        head = b'{"total": 1, "offset": 0, "limit": 10, "items": ['
+
+        def stalled_body():
+            yield head
+            time.sleep(0.5)
+            yield b"]}"
+
+        def respond(path):
+            return 200, {"Content-Length": str(len(head) + 2)}, stalled_body()
+
+        with abc_radio_wrapper.ABCRadio(stream=True, timeout=0.1) as ABCWrapper:
+            ABCWrapper.BASE_URL = self.serve(respond)
+            with self.assertRaises(abc_radio_wrapper.ABCRadioError) as cm:
+                ABCWrapper.search()
+        self.assertIsInstance(cm.exception.__cause__, urllib3.exceptions.HTTPError)
+
+    def test_042_test_Search_iter_broken_response(self):
+        """test a page that breaks off mid iteration raises ABCRadioError"""
+        item = json.dumps(self.json_search_result["items"][0]).encode()
+        head = b'{"total": 2, "offset": 0, "limit": 2, "items": [' + item + b","
+        responses = [
+            # truncated after the first item
+            ({"Content-Length": str(len(head) + 100)}, head),
+            # invalid compressed body
+            ({"Content-Encoding": "gzip"}, b"not gzip"),
+        ]
+
+        def respond(path):
+            headers, body = responses[int(path.rsplit("=", 1)[-1])]
+            return 200, headers, body
+
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            ABCWrapper.BASE_URL = self.serve(respond)
+            for offset in range(len(responses)):
+                with self.subTest(offset=offset):
+                    with self.assertRaises(abc_radio_wrapper.ABCRadioError):
+                        for _ in ABCWrapper.search_iter(offset=offset):
+                            pass
+
+    def test_043_test_SearchResult_keeps_releases_of_a_group_apart(self):
+        """test releases sharing a musicbrainz release group stay separate albums"""
+        json_input = dict(self.json_search_result)
+        first = json_input["items"][1]
+        second = copy.deepcopy(first)
+        second["release"].update(
+            arid="other-release", title="Deluxe Edition", release_year="2021"
+        )
+        json_input["items"] = [first, second]
+        radio_songs = abc_radio_wrapper.SearchResult.from_json(json_input).radio_songs
+
+        for radio_song, json_item in zip(radio_songs, (first, second)):
+            self.assertEqual(
+                abc_radio_wrapper.Song.from_json(json_item), radio_song.song
+            )
+        self.assertEqual(
+            ("Deluxe Edition", 2021),
+            (radio_songs[1].song.album.title, radio_songs[1].song.album.release_year),
+        )
+        self.assertIs(radio_songs[0].song.artists[0], radio_songs[1].song.artists[0])
+
+    def test_044_test_page_urls_match_query_string(self):
+        """test every page of a search is requested with the same url"""
+        endDate: datetime = datetime.fromisoformat("2020-04-30T03:16:00+00:00")
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            for params in (
+                {},
+                {"limit": 10},
+                {"to": endDate, "station": "jazz", "limit": 10, "offset": 5},
+            ):
+                with self.subTest(**params):
+                    self.assertEqual(
+                        ABCWrapper.BASE_URL
+                        + ABCWrapper.construct_query_string(**dict(params, offset=20)),
+                        next(ABCWrapper._page_urls(params, (20,))),
+                    )
+
+            requested: List[str] = []
+            ABCWrapper.BASE_URL = self.serve_pages(30, requested)
+            ABCWrapper.search(to=endDate, limit=10, offset=10)
+            self.assertEqual(
+                3, len(list(ABCWrapper.continuous_search(to=endDate, limit=10)))
+            )
+            # offset=10 is answered from the cache
+            self.assertEqual(3, len(requested))
+            self.assertEqual(len(requested), len(set(requested)))
+
+    def test_045_test_search_cache(self):
+        """test past searches are cached and evicted least recently used first"""
+        endDate: datetime = datetime.fromisoformat("2020-04-30T03:16:00+00:00")
+        requested: List[str] = []
+        with abc_radio_wrapper.ABCRadio(cache_size=2) as ABCWrapper:
+            ABCWrapper.BASE_URL = self.serve_pages(30, requested)
+            first = ABCWrapper.search(to=endDate, limit=10)
+            self.assertIs(first, ABCWrapper.search(to=endDate, limit=10))
+            self.assertEqual(1, len(requested))
+
+            ABCWrapper.search(to=endDate, limit=10, offset=10)
+            ABCWrapper.search(to=endDate, limit=10, offset=20)
+            self.assertEqual(3, len(requested))
+            # the first page was used least recently and has been evicted
+            self.assertIsNot(first, ABCWrapper.search(to=endDate, limit=10))
+            self.assertEqual(4, len(requested))
+            ABCWrapper.search(to=endDate, limit=10, offset=20)
+            self.assertEqual(4, len(requested))
+
+            # searches that can still change are never cached
+            ABCWrapper.search(limit=10)
+            ABCWrapper.search(limit=10)
+            self.assertEqual(6, len(requested))
+
+        requested.clear()
+        with abc_radio_wrapper.ABCRadio(cache_size=0) as ABCWrapper:
+            ABCWrapper.BASE_URL = self.serve_pages(30, requested)
+            ABCWrapper.search(to=endDate, limit=10)
+            ABCWrapper.search(to=endDate, limit=10)
+            self.assertEqual(2, len(requested))
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("aiohttp") and importlib.util.find_spec("aiolimiter"),
+        "requires aiohttp and aiolimiter",
+    )
+    def test_046_test_async_retries_rate_limited_pages(self):
+        """
+        test continuous_search_async retries a page answered with 429 after the
+        Retry-After delay and gives up after _MAX_RETRIES retries
+        """
+        attempts = abc_radio_wrapper._MAX_RETRIES + 1
+        for limited in (2, attempts):
+            with self.subTest(limited=limited):
+                requested: List[str] = []
+
+                def respond(path, limited=limited, requested=requested):
+                    requested.append(path)
+                    if "offset=10" in path and requested.count(path) <= limited:
+                        return 429, {"Retry-After": "0"}, b""
+                    page = {"total": 20, "offset": 0, "limit": 10, "items": []}
+                    return 200, {}, json.dumps(page).encode()
+
+                with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+                    ABCWrapper.BASE_URL = self.serve(respond)
+                    search = ABCWrapper.continuous_search_async(limit=10)
+                    if limited < attempts:
+                        self.assertEqual(2, len(asyncio.run(search)))
+                    else:
+                        with self.assertRaises(abc_radio_wrapper.ABCRadioError):
+                            asyncio.run(search)
+                retried = sum("offset=10" in path for path in requested)
+                self.assertEqual(min(limited + 1, attempts), retried)
+
+    def test_047_test_continuous_search_zero_limit(self):
+        """test a page with a limit of 0 ends the search instead of raising"""
+        requested: List[str] = []
+
+        def respond(path):
+            requested.append(path)
+            page = {"total": 20, "offset": 0, "limit": 0, "items": []}
+            return 200, {}, json.dumps(page).encode()
+
+        with abc_radio_wrapper.ABCRadio() as ABCWrapper:
+            ABCWrapper.BASE_URL = self.serve(respond)
+            self.assertEqual(1, len(list(ABCWrapper.continuous_search(limit=0))))
+            self.assertEqual([], list(ABCWrapper.search_iter(limit=0)))
+            if importlib.util.find_spec("aiohttp") and importlib.util.find_spec(
+                "aiolimiter"
+            ):
+                searchresults = asyncio.run(ABCWrapper.continuous_search_async(limit=0))
+                self.assertEqual(1, len(searchresults))
+        self.assertTrue(all("limit=0" in path for path in requested))